@@ -2,21 +2,101 @@
 
 from __future__ import annotations
 
+import os
 from abc import ABC, abstractmethod
-from typing import Iterable, List, Mapping
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Iterable, List, Mapping, Optional
 
 from ..models import Order
 
+#: Batch size above which import_orders fans parsing out to worker processes.
+#: Payload parsing is independent per order, but process startup and IPC only
+#: pay off on genuinely large imports.
+_PARALLEL_THRESHOLD = 1000
+
+
+def _first_str(
+    payload: Mapping[str, object],
+    primary: str,
+    secondary: Optional[str] = None,
+    default: str = "",
+) -> str:
+    """Return the first non-empty value of ``primary``/``secondary`` as a str.
+
+    Replaces the ``str(payload.get(a) or payload.get(b) or "")`` idiom used
+    throughout the importers: values that are already non-empty strings are
+    returned without an extra ``str()`` call, and the second lookup only runs
+    when the first one missed.
+    """
+
+    value = payload.get(primary)
+    if isinstance(value, str):
+        if value:
+            return value
+    elif value:
+        return str(value)
+    if secondary is not None:
+        value = payload.get(secondary)
+        if isinstance(value, str):
+            if value:
+                return value
+        elif value:
+            return str(value)
+    return default
+
+
+def _as_int(value: object, default: int = 0) -> int:
+    """Coerce ``value`` to an int, skipping the cast when it already is one."""
+
+    if type(value) is int:
+        return value
+    return int(value) if value else default  # type: ignore[call-overload]
+
+
+def _as_float(value: object, default: float = 0.0) -> float:
+    """Coerce ``value`` to a float, skipping the cast when it already is one."""
+
+    if type(value) is float:
+        return value
+    return float(value) if value else default  # type: ignore[arg-type]
+
 
 class BaseOrderImporter(ABC):
     """Base class used by channel specific order importers."""
 
     platform: str
 
+    def __init__(self, *, keep_raw_payload: bool = True) -> None:
+        #: Whether parsed orders retain a reference to their source payload.
+        #: Dropping it roughly halves the memory footprint of bulk imports
+        #: since nothing on the reporting path reads it back.
+        self.keep_raw_payload = keep_raw_payload
+
     def import_orders(self, raw_orders: Iterable[Mapping[str, object]]) -> List[Order]:
-        """Transform raw order payloads into normalized :class:`Order` objects."""
+        """Transform raw order payloads into normalized :class:`Order` objects.
+
+        Large batches are parsed across worker processes since each payload is
+        independent; anything below :data:`_PARALLEL_THRESHOLD` stays on the
+        cheaper serial path.
+        """
+
+        payloads = raw_orders if isinstance(raw_orders, list) else list(raw_orders)
+        if len(payloads) >= _PARALLEL_THRESHOLD:
+            try:
+                return self._import_orders_parallel(payloads)
+            except (BrokenProcessPool, OSError):
+                # Fall back to serial parsing on platforms where worker
+                # processes are unavailable (restricted environments, etc.).
+                pass
+        parse_order = self.parse_order
+        return [parse_order(payload) for payload in payloads]
 
-        return [self.parse_order(payload) for payload in raw_orders]
+    def _import_orders_parallel(self, payloads: List[Mapping[str, object]]) -> List[Order]:
+        workers = os.cpu_count() or 1
+        chunksize = max(1, len(payloads) // (4 * workers))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(self.parse_order, payloads, chunksize=chunksize))
 
     @abstractmethod
     def parse_order(self, payload: Mapping[str, object]) -> Order:
@@ -2,11 +2,32 @@
 
 from __future__ import annotations
 
+import sys
 from datetime import datetime, timezone
-from typing import Mapping
+from functools import lru_cache
+from math import fsum
+from typing import Mapping, Union
 
 from ..models import Order, OrderItem
-from .base import BaseOrderImporter
+from .base import BaseOrderImporter, _as_float, _as_int, _first_str
+
+
+@lru_cache(maxsize=4096)
+def _parse_epoch(value: Union[int, float, str]) -> datetime:
+    """Convert an epoch timestamp into an aware ``datetime``, memoized.
+
+    Bulk Etsy exports repeat identical ``creation_tsz`` values, so caching on
+    the raw value lets identical timestamps short-circuit the conversion.
+    """
+
+    return datetime.fromtimestamp(float(value), tz=timezone.utc)
+
+
+@lru_cache(maxsize=4096)
+def _parse_iso(value: str) -> datetime:
+    """Parse an ISO-8601 timestamp, memoized on the raw string."""
+
+    return datetime.fromisoformat(value)
 
 
 class EtsyOrderImporter(BaseOrderImporter):
@@ -15,18 +36,24 @@ class EtsyOrderImporter(BaseOrderImporter):
     platform = "etsy"
 
     def parse_order(self, payload: Mapping[str, object]) -> Order:
-        receipt_id = str(payload.get("receipt_id") or payload.get("order_id"))
-        buyer = payload.get("buyer") or {}
-        customer_name = str(buyer.get("name") or buyer.get("username") or "")
-        customer_email = str(buyer.get("email") or "")
-        created_at = self._parse_datetime(payload.get("creation_tsz"))
-        status = str(payload.get("status") or "open")
-        currency = str(payload.get("currency_code") or "USD")
-        transactions = payload.get("transactions") or []
-
-        items = [self._parse_transaction(tx, currency) for tx in transactions]
-        total_price = float(payload.get("grandtotal") or sum(item.price * item.quantity for item in items))
-        fulfillment_status = str(payload.get("fulfillment_status") or payload.get("was_paid") or "pending")
+        # Bind the mapping lookup once; parse_order runs per payload on bulk
+        # imports, so the repeated attribute dispatch adds up.
+        get = payload.get
+        receipt_id = _first_str(payload, "receipt_id", "order_id")
+        buyer = get("buyer") or {}
+        customer_name = _first_str(buyer, "name", "username")
+        customer_email = _first_str(buyer, "email")
+        created_at = self._parse_datetime(get("creation_tsz"))
+        status = sys.intern(_first_str(payload, "status", default="open").lower())
+        currency = _first_str(payload, "currency_code", default="USD")
+        transactions = get("transactions") or []
+
+        parse_transaction = self._parse_transaction
+        items = [parse_transaction(tx, currency) for tx in transactions]
+        total_price = _as_float(get("grandtotal") or fsum(item.price * item.quantity for item in items))
+        fulfillment_status = sys.intern(
+            _first_str(payload, "fulfillment_status", "was_paid", default="pending").lower()
+        )
 
         return Order(
             id=receipt_id,
@@ -39,32 +66,31 @@ class EtsyOrderImporter(BaseOrderImporter):
             total_price=total_price,
             items=items,
             fulfillment_status=fulfillment_status if fulfillment_status else None,
-            raw_payload=payload,
+            raw_payload=payload if self.keep_raw_payload else None,
         )
 
     @staticmethod
     def _parse_transaction(payload: Mapping[str, object], default_currency: str) -> OrderItem:
-        currency = str(payload.get("currency_code") or default_currency)
+        currency = _first_str(payload, "currency_code", default=default_currency)
+        transaction_id = _first_str(payload, "transaction_id")
         return OrderItem(
-            sku=str(payload.get("product_id") or payload.get("listing_id") or ""),
-            name=str(payload.get("title") or payload.get("name") or ""),
-            quantity=int(payload.get("quantity") or 0),
-            price=float(payload.get("price") or payload.get("transaction_total") or 0.0),
+            sku=_first_str(payload, "product_id", "listing_id"),
+            name=_first_str(payload, "title", "name"),
+            quantity=_as_int(payload.get("quantity")),
+            price=_as_float(payload.get("price") or payload.get("transaction_total")),
             currency=currency,
-            metadata={
-                "transaction_id": str(payload.get("transaction_id") or ""),
-            },
+            metadata={"transaction_id": transaction_id} if transaction_id else None,
         )
 
     @staticmethod
     def _parse_datetime(value: object) -> datetime:
         if isinstance(value, (int, float)):
-            return datetime.fromtimestamp(float(value), tz=timezone.utc)
+            return _parse_epoch(value)
         if isinstance(value, str) and value.isdigit():
-            return datetime.fromtimestamp(float(value), tz=timezone.utc)
+            return _parse_epoch(value)
         if isinstance(value, str):
             try:
-                return datetime.fromisoformat(value)
+                return _parse_iso(value)
             except ValueError:
                 pass
         return datetime.now(tz=timezone.utc)
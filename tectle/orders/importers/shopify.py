@@ -2,11 +2,37 @@
 
 from __future__ import annotations
 
+import sys
 from datetime import datetime, timezone
+from functools import lru_cache
+from math import fsum
 from typing import Mapping
 
 from ..models import Order, OrderItem
-from .base import BaseOrderImporter
+from .base import BaseOrderImporter, _as_float, _as_int, _first_str
+
+try:  # pragma: no cover - optional C accelerator
+    from ciso8601 import parse_rfc3339 as _parse_rfc3339
+except ImportError:
+    _parse_rfc3339 = None
+
+
+@lru_cache(maxsize=4096)
+def _parse_iso(value: str) -> datetime:
+    """Parse an ISO-8601 timestamp, memoized on the raw string.
+
+    Shopify payloads repeat the same timestamps and offsets constantly, so
+    caching the parsed ``datetime`` avoids rebuilding tzinfo objects and
+    intermediate strings for every order. When ciso8601 is installed its C
+    parser handles the RFC 3339 form (including the ``Z`` suffix) directly.
+    """
+
+    if _parse_rfc3339 is not None:
+        try:
+            return _parse_rfc3339(value)
+        except ValueError:
+            pass
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
 
 
 class ShopifyOrderImporter(BaseOrderImporter):
@@ -15,17 +41,23 @@ class ShopifyOrderImporter(BaseOrderImporter):
     platform = "shopify"
 
     def parse_order(self, payload: Mapping[str, object]) -> Order:
-        order_id = str(payload.get("id"))
-        customer = payload.get("customer") or {}
+        # Bind the mapping lookup once; parse_order runs per payload on bulk
+        # imports, so the repeated attribute dispatch adds up.
+        get = payload.get
+        order_id = _first_str(payload, "id")
+        customer = get("customer") or {}
         customer_name = self._build_customer_name(customer)
-        customer_email = str(customer.get("email") or payload.get("email") or "")
-        created_at = self._parse_datetime(payload.get("created_at"))
-        status = str(payload.get("financial_status") or payload.get("fulfillment_status") or "open")
-        currency = str(payload.get("currency") or "USD")
-        fulfillment_status = payload.get("fulfillment_status")
+        customer_email = _first_str(customer, "email") or _first_str(payload, "email")
+        created_at = self._parse_datetime(get("created_at"))
+        status = sys.intern(
+            _first_str(payload, "financial_status", "fulfillment_status", default="open").lower()
+        )
+        currency = _first_str(payload, "currency", default="USD")
+        fulfillment_status = get("fulfillment_status")
 
-        items = [self._parse_line_item(item, currency) for item in payload.get("line_items") or []]
-        total_price = float(payload.get("total_price") or sum(item.price * item.quantity for item in items))
+        parse_line_item = self._parse_line_item
+        items = [parse_line_item(item, currency) for item in get("line_items") or []]
+        total_price = _as_float(get("total_price") or fsum(item.price * item.quantity for item in items))
 
         return Order(
             id=order_id,
@@ -37,22 +69,26 @@ class ShopifyOrderImporter(BaseOrderImporter):
             currency=currency,
             total_price=total_price,
             items=items,
-            fulfillment_status=str(fulfillment_status) if fulfillment_status else None,
-            raw_payload=payload,
+            fulfillment_status=sys.intern(str(fulfillment_status).lower()) if fulfillment_status else None,
+            raw_payload=payload if self.keep_raw_payload else None,
         )
 
     @staticmethod
     def _parse_line_item(payload: Mapping[str, object], default_currency: str) -> OrderItem:
+        metadata = {}
+        variant_title = _first_str(payload, "variant_title")
+        if variant_title:
+            metadata["variant_title"] = variant_title
+        item_fulfillment = _first_str(payload, "fulfillment_status")
+        if item_fulfillment:
+            metadata["fulfillment_status"] = item_fulfillment
         return OrderItem(
-            sku=str(payload.get("sku") or payload.get("variant_id") or ""),
-            name=str(payload.get("title") or ""),
-            quantity=int(payload.get("quantity") or 0),
-            price=float(payload.get("price") or 0.0),
-            currency=str(payload.get("currency") or default_currency),
-            metadata={
-                "variant_title": str(payload.get("variant_title") or ""),
-                "fulfillment_status": str(payload.get("fulfillment_status") or ""),
-            },
+            sku=_first_str(payload, "sku", "variant_id"),
+            name=_first_str(payload, "title"),
+            quantity=_as_int(payload.get("quantity")),
+            price=_as_float(payload.get("price")),
+            currency=_first_str(payload, "currency", default=default_currency),
+            metadata=metadata or None,
         )
 
     @staticmethod
@@ -69,7 +105,7 @@ class ShopifyOrderImporter(BaseOrderImporter):
     def _parse_datetime(value: object) -> datetime:
         if isinstance(value, str):
             try:
-                return datetime.fromisoformat(value.replace("Z", "+00:00"))
+                return _parse_iso(value)
             except ValueError:
                 pass
         return datetime.now(tz=timezone.utc)
@@ -6,6 +6,11 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Dict, Iterable, List, Mapping, Optional
 
+#: Statuses that mark an order as still requiring action. The literals are
+#: interned by the compiler, so membership tests against importer-normalized
+#: statuses reduce to pointer comparisons.
+_OPEN_STATUSES = frozenset({"open", "unfulfilled", "processing"})
+
 
 @dataclass(slots=True)
 class OrderItem:
@@ -16,10 +21,16 @@ class OrderItem:
     quantity: int
     price: float
     currency: str
-    metadata: Dict[str, str] = field(default_factory=dict)
+    #: Extra per-channel attributes. ``None`` (the common case) avoids
+    #: allocating an empty dict for every line item.
+    metadata: Optional[Dict[str, str]] = None
 
     def as_dict(self) -> Dict[str, object]:
-        """Serialize the order item to a dictionary."""
+        """Serialize the order item to a dictionary.
+
+        The ``metadata`` entry shares identity with the stored mapping rather
+        than copying it; callers must treat it as read-only.
+        """
 
         return {
             "sku": self.sku,
@@ -27,13 +38,20 @@ class OrderItem:
             "quantity": self.quantity,
             "price": self.price,
             "currency": self.currency,
-            "metadata": dict(self.metadata),
+            "metadata": self.metadata or {},
         }
 
 
 @dataclass(slots=True)
 class Order:
-    """Represents a normalized order coming from any sales channel."""
+    """Represents a normalized order coming from any sales channel.
+
+    Importers normalize ``status`` and ``platform`` to lowercase; grouping
+    and filtering (``OrderOrganizer.group_by_status``, the dashboard's
+    status/platform buckets) rely on that and use the stored values as keys
+    verbatim. Directly constructed orders should follow the same convention,
+    though ``is_open`` itself tolerates any casing.
+    """
 
     id: str
     platform: str
@@ -46,6 +64,14 @@ class Order:
     items: List[OrderItem]
     fulfillment_status: Optional[str] = None
     raw_payload: Optional[Mapping[str, object]] = None
+    _is_open: bool = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # status is fixed at construction, so the open-state check is done
+        # once here instead of on every is_open access. Lowering keeps the
+        # original case-insensitive behavior for directly built orders at
+        # no per-access cost.
+        self._is_open = self.status.lower() in _OPEN_STATUSES
 
     def as_dict(self) -> Dict[str, object]:
         """Serialize the order to a dictionary for downstream consumers."""
@@ -67,7 +93,7 @@ class Order:
     def is_open(self) -> bool:
         """Return whether the order is in a state that requires action."""
 
-        return self.status.lower() in {"open", "unfulfilled", "processing"}
+        return self._is_open
 
     @property
     def total_quantity(self) -> int:
@@ -2,16 +2,23 @@
 
 from __future__ import annotations
 
-from collections import defaultdict
+from collections import Counter
 from dataclasses import dataclass
-from typing import Dict, Iterable, List, Mapping, MutableMapping, Sequence
+from operator import attrgetter
+from typing import Dict, Iterable, List, Mapping, Sequence
 
 from .models import Order
 
+_created_at = attrgetter("created_at")
 
-@dataclass(slots=True)
+
+@dataclass(slots=True, frozen=True)
 class OrderSummary:
-    """Aggregated statistics about a set of orders."""
+    """Aggregated statistics about a set of orders.
+
+    Frozen so summaries are hashable value objects, which lets downstream
+    consumers memoize report output keyed by the summary.
+    """
 
     total_orders: int
     open_orders: int
@@ -23,26 +30,31 @@ class OrderOrganizer:
     """Helper utilities for grouping and summarising orders."""
 
     def group_by_status(self, orders: Iterable[Order]) -> Dict[str, List[Order]]:
-        """Group orders by their status."""
+        """Group orders by their status.
 
-        grouped: MutableMapping[str, List[Order]] = defaultdict(list)
+        Statuses are normalized to lowercase by the importers, so the stored
+        value is used directly as the bucket key.
+        """
+
+        grouped: Dict[str, List[Order]] = {}
+        setdefault = grouped.setdefault
         for order in orders:
-            grouped[order.status.lower()].append(order)
-        return dict(grouped)
+            setdefault(order.status, []).append(order)
+        return grouped
 
     def group_by_fulfillment(self, orders: Iterable[Order]) -> Dict[str, List[Order]]:
         """Group orders by fulfillment status."""
 
-        grouped: MutableMapping[str, List[Order]] = defaultdict(list)
+        grouped: Dict[str, List[Order]] = {}
+        setdefault = grouped.setdefault
         for order in orders:
-            key = (order.fulfillment_status or "unfulfilled").lower()
-            grouped[key].append(order)
-        return dict(grouped)
+            setdefault(order.fulfillment_status or "unfulfilled", []).append(order)
+        return grouped
 
     def sort_orders(self, orders: Sequence[Order], *, reverse: bool = False) -> List[Order]:
         """Return orders sorted by creation date."""
 
-        return sorted(orders, key=lambda order: order.created_at, reverse=reverse)
+        return sorted(orders, key=_created_at, reverse=reverse)
 
     def summary(self, orders: Iterable[Order]) -> OrderSummary:
         """Produce an :class:`OrderSummary` for the supplied orders."""
@@ -55,7 +67,8 @@ class OrderOrganizer:
         for order in orders:
             total_orders += 1
             total_revenue += order.total_price
-            total_items += order.total_quantity
+            for item in order.items:
+                total_items += item.quantity
             if order.is_open:
                 open_orders += 1
 
@@ -67,13 +80,37 @@ class OrderOrganizer:
         )
 
     def to_report(self, orders: Iterable[Order]) -> Mapping[str, object]:
-        """Build a dictionary report summarising the orders."""
+        """Build a dictionary report summarising the orders.
+
+        The summary totals and both groupings are tallied in a single pass so
+        the orders are iterated once instead of three times and no per-bucket
+        order lists are materialised.
+        """
+
+        total_orders = 0
+        open_orders = 0
+        total_revenue = 0.0
+        total_items = 0
+        status_counts: Counter[str] = Counter()
+        fulfillment_counts: Counter[str] = Counter()
+
+        for order in orders:
+            total_orders += 1
+            total_revenue += order.total_price
+            for item in order.items:
+                total_items += item.quantity
+            if order.is_open:
+                open_orders += 1
+            status_counts[order.status] += 1
+            fulfillment_counts[order.fulfillment_status or "unfulfilled"] += 1
 
-        orders_list = list(orders)
         return {
-            "summary": self.summary(orders_list),
-            "by_status": {k: len(v) for k, v in self.group_by_status(orders_list).items()},
-            "by_fulfillment": {
-                k: len(v) for k, v in self.group_by_fulfillment(orders_list).items()
-            },
+            "summary": OrderSummary(
+                total_orders=total_orders,
+                open_orders=open_orders,
+                total_revenue=round(total_revenue, 2),
+                total_items=total_items,
+            ),
+            "by_status": dict(status_counts),
+            "by_fulfillment": dict(fulfillment_counts),
         }
@@ -5,13 +5,16 @@ from __future__ import annotations
 import argparse
 import html
 import json
+import threading
 from collections import Counter
-from dataclasses import dataclass
+from concurrent.futures import Future
+from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
 from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
-from typing import List, Mapping, Optional, Sequence
-from urllib.parse import parse_qs, urlencode, urlparse
+from typing import Dict, Iterator, List, Mapping, Optional, Sequence, Tuple
+from urllib.parse import quote, unquote, unquote_plus, urlencode
 
 from tectle.orders.models import Order
 from tectle.orders.organizer import OrderOrganizer, OrderSummary
@@ -19,6 +22,225 @@ from tectle.orders.service import OrderService
 
 from .sample_data import load_sample_payloads
 
+try:  # pragma: no cover - optional C accelerator
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+
+def _json_loads_bytes(data: bytes) -> object:
+    """Decode a JSON document from bytes, via orjson when available."""
+
+    if _orjson is not None:
+        return _orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_pretty(payload: object) -> str:
+    """Pretty-print a payload for display, via orjson when available."""
+
+    if _orjson is not None:
+        return _orjson.dumps(
+            payload, option=_orjson.OPT_INDENT_2 | _orjson.OPT_NON_STR_KEYS, default=str
+        ).decode()
+    return json.dumps(payload, indent=2, default=str)
+
+
+#: Maximum number of rendered pages kept per state; one page per distinct
+#: filter combination, evicted oldest-first.
+_RENDER_CACHE_MAX = 32
+
+#: How long a coalesced request waits for the leader's page before giving
+#: up and rendering independently.
+_RENDER_WAIT_TIMEOUT = 10.0
+
+
+#: Stylesheet served from /static/dashboard.css. Kept out of the page body
+#: so responses shrink by several KB and browsers can cache it.
+_CSS_BYTES = b"""\
+        :root {
+            color-scheme: light dark;
+            font-family: system-ui, sans-serif;
+        }
+        body {
+            margin: 0;
+            padding: 0;
+            background: #f6f8fb;
+            color: #1d1f24;
+        }
+        header {
+            background: linear-gradient(120deg, #2845ff, #7324ff);
+            color: white;
+            padding: 2.5rem 3rem 1.5rem;
+        }
+        header h1 {
+            margin: 0 0 0.5rem 0;
+            font-size: 2rem;
+        }
+        header p {
+            margin: 0;
+            opacity: 0.85;
+        }
+        main {
+            padding: 2rem 3rem 4rem;
+        }
+        .summary {
+            display: grid;
+            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
+            gap: 1rem;
+            margin-bottom: 2rem;
+        }
+        .metric {
+            background: white;
+            border-radius: 0.75rem;
+            padding: 1rem 1.25rem;
+            box-shadow: 0 10px 25px rgba(31, 35, 45, 0.1);
+        }
+        .metric .label {
+            display: block;
+            font-size: 0.85rem;
+            text-transform: uppercase;
+            letter-spacing: 0.08em;
+            color: #5b6170;
+            margin-bottom: 0.35rem;
+        }
+        .metric .value {
+            font-size: 1.75rem;
+            font-weight: 600;
+        }
+        .filters {
+            display: grid;
+            grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
+            gap: 1.5rem;
+            margin-bottom: 2rem;
+        }
+        .filters h2 {
+            margin-bottom: 0.5rem;
+        }
+        .filter-group {
+            display: flex;
+            flex-wrap: wrap;
+            gap: 0.5rem;
+        }
+        .filter-link {
+            display: inline-flex;
+            align-items: center;
+            border-radius: 999px;
+            padding: 0.35rem 0.9rem;
+            background: rgba(115, 36, 255, 0.1);
+            color: #4520a5;
+            text-decoration: none;
+            font-weight: 500;
+        }
+        .filter-link.active {
+            background: #4520a5;
+            color: white;
+        }
+        table.orders {
+            width: 100%;
+            border-collapse: collapse;
+            background: white;
+            border-radius: 1rem;
+            overflow: hidden;
+            box-shadow: 0 10px 30px rgba(31, 35, 45, 0.12);
+        }
+        table.orders th {
+            text-align: left;
+            padding: 0.75rem 1rem;
+            background: #f0f2f8;
+            color: #3a3f4b;
+            font-size: 0.9rem;
+            text-transform: uppercase;
+            letter-spacing: 0.05em;
+        }
+        table.orders td {
+            padding: 1rem;
+            vertical-align: top;
+            border-top: 1px solid #eef0f6;
+        }
+        table.orders tr:first-child td {
+            border-top: none;
+        }
+        .status {
+            display: inline-flex;
+            align-items: center;
+            padding: 0.25rem 0.75rem;
+            border-radius: 999px;
+            background: rgba(40, 69, 255, 0.12);
+            color: #2845ff;
+            font-weight: 600;
+            font-size: 0.85rem;
+        }
+        details {
+            margin-top: 0.5rem;
+        }
+        details summary {
+            cursor: pointer;
+            font-weight: 600;
+            color: #2845ff;
+        }
+        ul.items {
+            margin: 0.5rem 0 0 1rem;
+            padding: 0;
+            list-style-type: disc;
+        }
+        ul.items li {
+            margin-bottom: 0.35rem;
+        }
+        .muted {
+            color: #6b7183;
+            font-size: 0.85rem;
+        }
+        pre {
+            background: #0f172a;
+            color: #e2e8f0;
+            padding: 1rem;
+            border-radius: 0.75rem;
+            overflow-x: auto;
+        }
+        .empty {
+            padding: 2rem;
+            background: white;
+            border-radius: 1rem;
+            text-align: center;
+            color: #5b6170;
+            box-shadow: 0 10px 30px rgba(31, 35, 45, 0.05);
+        }
+        @media (prefers-color-scheme: dark) {
+            body {
+                background: #0f172a;
+                color: #e2e8f0;
+            }
+            header {
+                box-shadow: 0 20px 40px rgba(0, 0, 0, 0.35);
+            }
+            .metric, table.orders, .empty {
+                background: rgba(15, 23, 42, 0.8);
+                box-shadow: 0 10px 30px rgba(15, 23, 42, 0.4);
+            }
+            table.orders th {
+                background: rgba(148, 163, 184, 0.15);
+            }
+            table.orders td {
+                border-top-color: rgba(148, 163, 184, 0.1);
+            }
+            .filter-link {
+                background: rgba(129, 140, 248, 0.2);
+                color: #c7d2fe;
+            }
+            .filter-link.active {
+                background: #6366f1;
+            }
+            .muted {
+                color: #94a3b8;
+            }
+            pre {
+                background: rgba(15, 23, 42, 0.95);
+            }
+        }
+    
+"""
+
 
 @dataclass(slots=True)
 class DashboardState:
@@ -26,38 +248,211 @@ class DashboardState:
 
     orders: List[Order]
     organizer: OrderOrganizer
+    #: Epoch of the order set; keys the render cache and in-flight futures
+    #: so any future mutation path invalidates pages by bumping it.
+    version: int = 0
+    _render_cache: Dict[Tuple[int, Optional[str], Optional[str]], bytes] = field(
+        default_factory=dict
+    )
+    #: Per-status and per-platform order tallies, refreshed on mutation so
+    #: filter rendering never rescans the order list.
+    status_counts: Counter = field(default_factory=Counter)
+    platform_counts: Counter = field(default_factory=Counter)
+    #: (platform, id) -> Order index backing the payload endpoint lookups.
+    _index: Dict[Tuple[str, str], Order] = field(default_factory=dict)
+    #: Newest-first order buckets per status and per platform, refreshed
+    #: alongside the counts so single-filter requests touch only matches.
+    _by_status: Dict[str, List[Order]] = field(default_factory=dict)
+    _by_platform: Dict[str, List[Order]] = field(default_factory=dict)
+    #: Rendered row markup keyed by (platform, id). Row HTML is
+    #: filter-independent, so each order renders once per state, and a
+    #: state-owned cache means throwaway states (render_dashboard) can
+    #: never serve rows from a previous order set.
+    _row_cache: Dict[Tuple[str, str], str] = field(default_factory=dict)
+    #: In-flight renders keyed like the render cache; concurrent requests
+    #: for the same cold page wait on one future instead of all rendering.
+    _in_flight: Dict[Tuple[int, Optional[str], Optional[str]], "Future[bytes]"] = field(
+        default_factory=dict
+    )
+    _render_lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def __post_init__(self) -> None:
+        # Keep the list newest-first from the start; filtering preserves
+        # order, so no per-request sorting is needed afterwards.
+        self.orders = self.organizer.sort_orders(self.orders, reverse=True)
+        self._index = {(order.platform, order.id): order for order in self.orders}
+        self._recount()
+
+    def _recount(self) -> None:
+        by_status: Dict[str, List[Order]] = {}
+        by_platform: Dict[str, List[Order]] = {}
+        status_bucket = by_status.setdefault
+        platform_bucket = by_platform.setdefault
+        # self.orders is newest-first, so buckets built in list order stay
+        # newest-first too. Importers intern lowercase statuses and
+        # platforms, so the stored values are bucket keys as-is.
+        for order in self.orders:
+            status_bucket(order.status, []).append(order)
+            platform_bucket(order.platform, []).append(order)
+        self._by_status = by_status
+        self._by_platform = by_platform
+        self.status_counts = Counter(
+            {status: len(bucket) for status, bucket in by_status.items()}
+        )
+        self.platform_counts = Counter(
+            {platform: len(bucket) for platform, bucket in by_platform.items()}
+        )
+
+    def store_page(
+        self, key: Tuple[int, Optional[str], Optional[str]], body: bytes
+    ) -> None:
+        """Cache an encoded page under the key claimed by :meth:`begin_render`.
+
+        The key carries the version observed when the render started, so a
+        page built from pre-mutation data can never be cached under (and
+        served for) a newer version.
+        """
+
+        cache = self._render_cache
+        with self._render_lock:
+            if len(cache) >= _RENDER_CACHE_MAX:
+                cache.pop(next(iter(cache)))
+            cache[key] = body
+
+    def begin_render(
+        self, *, status: Optional[str] = None, platform: Optional[str] = None
+    ) -> Tuple[
+        Optional[bytes],
+        Optional["Future[bytes]"],
+        Optional[Tuple[int, Optional[str], Optional[str]]],
+    ]:
+        """Claim or join the render for the given filters.
+
+        Returns ``(body, future, key)``: a cached ``body`` if one exists,
+        otherwise a shared future — with ``key`` non-``None`` for the one
+        caller that must render, resolve the future, and hand the key back
+        to :meth:`store_page` and :meth:`finish_render`.
+        """
+
+        key = (self.version, status, platform)
+        with self._render_lock:
+            body = self._render_cache.get(key)
+            if body is not None:
+                return body, None, None
+            future = self._in_flight.get(key)
+            if future is not None:
+                return None, future, None
+            future = Future()
+            self._in_flight[key] = future
+            return None, future, key
+
+    def finish_render(self, key: Tuple[int, Optional[str], Optional[str]]) -> None:
+        """Release the in-flight slot claimed by :meth:`begin_render`."""
+
+        with self._render_lock:
+            self._in_flight.pop(key, None)
+
+    def get_order(self, platform: str, order_id: str) -> Optional[Order]:
+        """Look up an order by platform and id via the persistent index."""
+
+        return self._index.get((platform, order_id))
 
     def filter_orders(
         self, *, status: Optional[str] = None, platform: Optional[str] = None
     ) -> List[Order]:
+        # Importers normalize status and platform to lowercase, so only the
+        # query-string inputs need lowering — once, outside the loop.
         status_key = status.lower() if status else None
         platform_key = platform.lower() if platform else None
-        filtered: List[Order] = []
-        for order in self.orders:
-            if status_key and order.status.lower() != status_key:
-                continue
-            if platform_key and order.platform.lower() != platform_key:
-                continue
-            filtered.append(order)
-        return self.organizer.sort_orders(filtered, reverse=True)
+        if status_key is None and platform_key is None:
+            return list(self.orders)
+        # Buckets are kept newest-first, so single-filter requests are a
+        # dict hit plus an O(|matches|) copy; the combined case scans the
+        # status bucket, which is usually the smaller of the two.
+        if status_key is None:
+            return list(self._by_platform.get(platform_key, ()))
+        bucket = self._by_status.get(status_key, ())
+        if platform_key is None:
+            return list(bucket)
+        return [order for order in bucket if order.platform == platform_key]
+
+
+@lru_cache(maxsize=4096)
+def _format_currency(value: float, currency: str) -> str:
+    """Format an amount as HTML-safe text.
 
+    The numeric part cannot contain markup, so only the payload-supplied
+    currency code is escaped — once per distinct (value, currency) pair
+    thanks to the cache, letting callers embed the result unescaped.
+    """
 
-def _format_currency(value: float, currency: str) -> str:
-    return f"{currency} {value:,.2f}" if currency else f"{value:,.2f}"
+    return f"{_escape(currency)} {value:,.2f}" if currency else f"{value:,.2f}"
 
 
+@lru_cache(maxsize=1024)
+def _escaped_title(value: str) -> str:
+    """Escape and title-case an enum-like field, cached on the raw string.
+
+    Statuses and platforms draw from a handful of distinct values, so after
+    warm-up the per-row cost is a dict hit instead of an html.escape scan.
+    """
+
+    return html.escape(value.title())
+
+
+@lru_cache(maxsize=1024)
+def _escaped_enum(value: str) -> str:
+    """Escape an enum-like field verbatim, cached on the raw string."""
+
+    return html.escape(value)
+
+
+@lru_cache(maxsize=4096)
 def _format_datetime(dt: datetime) -> str:
+    """Format a timestamp for display, cached on the (hashable) datetime.
+
+    strftime and the astimezone conversion dominate the cost; orders sharing
+    a timestamp — common for bulk-imported batches — format once.
+    """
+
     if dt.tzinfo:
         return dt.astimezone().strftime("%Y-%m-%d %H:%M %Z")
     return dt.strftime("%Y-%m-%d %H:%M")
 
 
-def _escape(value: object) -> str:
-    return html.escape(str(value))
+try:  # pragma: no cover - optional C accelerator
+    from markupsafe import escape as _ms_escape
+except ImportError:
+    _ms_escape = None
+
 
+#: Single-pass replacement table for the stdlib escape fallback;
+#: str.translate walks the string once where html.escape does five
+#: str.replace scans.
+_HTML_ESCAPE_TABLE = str.maketrans(
+    {"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#x27;"}
+)
 
-def _build_query(**params: Optional[str]) -> str:
-    cleaned = {k: v for k, v in params.items() if v}
+
+if _ms_escape is not None:
+
+    def _escape(value: object) -> str:
+        # markupsafe's C speedup escapes &<>"' in a single scan.
+        return str(_ms_escape(value))
+
+else:
+
+    def _escape(value: object) -> str:
+        if not isinstance(value, str):
+            value = str(value)
+        return value.translate(_HTML_ESCAPE_TABLE)
+
+
+@lru_cache(maxsize=256)
+def _build_query(status: Optional[str] = None, platform: Optional[str] = None) -> str:
+    """Build a filter href; memoized since filter values form a tiny set."""
+
+    cleaned = {k: v for k, v in (("status", status), ("platform", platform)) if v}
     if not cleaned:
         return "/"
     return "/?" + urlencode(cleaned)
@@ -69,9 +464,8 @@ def _render_filters(
     active_status: Optional[str] = None,
     active_platform: Optional[str] = None,
 ) -> str:
-    organizer = state.organizer
-    status_counts = organizer.group_by_status(state.orders)
-    platform_counts = Counter(order.platform.lower() for order in state.orders)
+    status_counts = state.status_counts
+    platform_counts = state.platform_counts
 
     status_links = [
         _filter_link(
@@ -80,13 +474,12 @@ def _render_filters(
             active=not active_status,
         )
     ]
-    for status, orders in sorted(status_counts.items()):
-        status_key = status.lower()
+    for status, count in sorted(status_counts.items()):
         status_links.append(
             _filter_link(
-                label=f"{status.title()} ({len(orders)})",
-                href=_build_query(status=status_key, platform=active_platform),
-                active=active_status == status_key,
+                label=f"{status.title()} ({count})",
+                href=_build_query(status=status, platform=active_platform),
+                active=active_status == status,
             )
         )
 
@@ -132,19 +525,16 @@ def _render_summary(summary: OrderSummary) -> str:
         ("Total Items", summary.total_items),
         ("Total Revenue", f"{summary.total_revenue:,.2f}"),
     ]
+    # Labels are literals and values are ints or number-format output, so
+    # neither needs an html.escape pass.
     metric_html = "".join(
-        f"<div class='metric'><span class='label'>{_escape(label)}</span><span class='value'>{_escape(value)}</span></div>"
+        f"<div class='metric'><span class='label'>{label}</span><span class='value'>{value}</span></div>"
         for label, value in metrics
     )
     return f"<section class='summary'>{metric_html}</section>"
 
 
-def _render_orders_table(orders: Sequence[Order]) -> str:
-    if not orders:
-        return "<p class='empty'>No orders match the current filters.</p>"
-
-    rows = "".join(_render_order_row(order) for order in orders)
-    return f"""
+_TABLE_OPEN = b"""
     <table class="orders">
         <thead>
             <tr>
@@ -157,308 +547,409 @@ def _render_orders_table(orders: Sequence[Order]) -> str:
                 <th>Details</th>
             </tr>
         </thead>
-        <tbody>{rows}</tbody>
+        <tbody>"""
+
+_TABLE_CLOSE = b"""</tbody>
     </table>
     """
 
 
-def _render_order_row(order: Order) -> str:
-    items_details = "".join(
-        f"<li><span class='sku'>{_escape(item.sku)}</span> — {_escape(item.name)} × {item.quantity} @ {_format_currency(item.price, item.currency)}</li>"
-        for item in order.items
-    )
-    raw_payload = json.dumps(order.raw_payload, indent=2, default=str) if order.raw_payload else "{}"
-    customer_email = _escape(order.customer_email) if order.customer_email else "<span class='muted'>No email</span>"
-    fulfillment = _escape(order.fulfillment_status or "—")
-    return f"""
+#: Number of table rows joined into each streamed section.
+_ROWS_PER_CHUNK = 100
+
+
+def _iter_orders_table(
+    orders: Sequence[Order], row_cache: Dict[Tuple[str, str], str]
+) -> Iterator[bytes]:
+    """Yield the orders table as UTF-8 bytes in :data:`_ROWS_PER_CHUNK` batches."""
+
+    if not orders:
+        yield b"<p class='empty'>No orders match the current filters.</p>"
+        return
+
+    yield _TABLE_OPEN
+    # Accumulate fragments in a list and join per batch rather than
+    # concatenating one big f-string per row; only the dynamic batches pay
+    # for an encode, the table skeleton is pre-encoded.
+    parts: List[str] = []
+    append = parts.append
+    pending = 0
+    for order in orders:
+        append(_order_row_html(order, row_cache))
+        pending += 1
+        if pending == _ROWS_PER_CHUNK:
+            yield "".join(parts).encode("utf-8")
+            parts.clear()
+            pending = 0
+    if parts:
+        yield "".join(parts).encode("utf-8")
+    yield _TABLE_CLOSE
+
+
+def _render_orders_table(orders: Sequence[Order]) -> bytes:
+    return b"".join(_iter_orders_table(orders, {}))
+
+
+#: Row and line-item markup, compiled once. format_map on a pre-escaped
+#: dict reuses the interned template instead of rebuilding a large f-string
+#: per row.
+_ROW_TEMPLATE = """
     <tr>
         <td>
-            <strong>{_escape(order.id)}</strong>
-            <div class="muted">{_escape(order.platform.title())}</div>
+            <strong>{id}</strong>
+            <div class="muted">{platform}</div>
         </td>
-        <td>{_escape(_format_datetime(order.created_at))}</td>
+        <td>{created}</td>
         <td>
-            <div>{_escape(order.customer_name or 'Unknown customer')}</div>
+            <div>{customer_name}</div>
             <div class="muted">{customer_email}</div>
         </td>
-        <td><span class="status">{_escape(order.status.title())}</span></td>
+        <td><span class="status">{status}</span></td>
         <td>{fulfillment}</td>
-        <td>{_escape(_format_currency(order.total_price, order.currency))}</td>
+        <td>{total}</td>
         <td>
             <details>
-                <summary>{len(order.items)} items / {order.total_quantity} units</summary>
-                <ul class="items">{items_details}</ul>
+                <summary>{item_count} items / {unit_count} units</summary>
+                <ul class="items">{items}</ul>
             </details>
-            <details>
+            <details class="payload" data-payload-url="{payload_url}">
                 <summary>Raw payload</summary>
-                <pre>{_escape(raw_payload)}</pre>
+                <pre>Loading payload…</pre>
             </details>
         </td>
     </tr>
     """
 
+_ITEM_TEMPLATE = "<li><span class='sku'>{sku}</span> — {name} × {quantity} @ {price}</li>"
+
+
+#: Upper bound on rows kept in a state's row cache; flushed wholesale if
+#: the order set ever outgrows it.
+_ROW_CACHE_MAX = 4096
+
+
+def _order_row_html(order: Order, cache: Dict[Tuple[str, str], str]) -> str:
+    key = (order.platform, order.id)
+    cached = cache.get(key)
+    if cached is None:
+        cached = _build_order_row(order)
+        if len(cache) >= _ROW_CACHE_MAX:
+            cache.clear()
+        cache[key] = cached
+    return cached
+
+
+def _build_order_row(order: Order) -> str:
+    item_format = _ITEM_TEMPLATE.format_map
+    return (
+        _ROW_TEMPLATE.format_map(
+            {
+                "id": _escape(order.id),
+                "platform": _escaped_title(order.platform),
+                "created": _escape(_format_datetime(order.created_at)),
+                "customer_name": _escape(order.customer_name or "Unknown customer"),
+                "customer_email": _escape(order.customer_email)
+                if order.customer_email
+                else "<span class='muted'>No email</span>",
+                "status": _escaped_title(order.status),
+                "fulfillment": _escaped_enum(order.fulfillment_status or "—"),
+                "total": _format_currency(order.total_price, order.currency),
+                "item_count": len(order.items),
+                "unit_count": order.total_quantity,
+                "items": "".join(
+                    item_format(
+                        {
+                            "sku": _escape(item.sku),
+                            "name": _escape(item.name),
+                            "quantity": item.quantity,
+                            "price": _format_currency(item.price, item.currency),
+                        }
+                    )
+                    for item in order.items
+                ),
+                "payload_url": f"/order/{quote(order.platform, safe='')}/{quote(order.id, safe='')}.json",
+            }
+        )
+    )
 
-def render_dashboard(
-    orders: Sequence[Order],
-    *,
-    status_filter: Optional[str] = None,
-    platform_filter: Optional[str] = None,
-) -> str:
-    """Return the dashboard HTML for the supplied orders."""
-
-    organizer = OrderOrganizer()
-    state = DashboardState(orders=list(organizer.sort_orders(orders, reverse=True)), organizer=organizer)
-    filtered = state.filter_orders(status=status_filter, platform=platform_filter)
-    summary = organizer.summary(filtered)
-    filters_html = _render_filters(state, active_status=(status_filter or "").lower() or None, active_platform=(platform_filter or "").lower() or None)
-    table_html = _render_orders_table(filtered)
 
-    def _label(value: Optional[str]) -> str:
-        if not value:
-            return "All"
-        return value.replace("_", " ").title()
+def _label(value: Optional[str]) -> str:
+    if not value:
+        return "All"
+    return value.replace("_", " ").title()
 
-    status_label = _label(status_filter)
-    platform_label = _label(platform_filter)
 
-    return f"""<!DOCTYPE html>
+#: Static page skeleton, compiled once. The head carries the only dynamic
+#: bits (order count and active filter labels) as format placeholders.
+_PAGE_HEAD_TEMPLATE = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="utf-8" />
     <title>Tectle Orders Dashboard</title>
-    <style>
-        :root {{
-            color-scheme: light dark;
-            font-family: system-ui, sans-serif;
-        }}
-        body {{
-            margin: 0;
-            padding: 0;
-            background: #f6f8fb;
-            color: #1d1f24;
-        }}
-        header {{
-            background: linear-gradient(120deg, #2845ff, #7324ff);
-            color: white;
-            padding: 2.5rem 3rem 1.5rem;
-        }}
-        header h1 {{
-            margin: 0 0 0.5rem 0;
-            font-size: 2rem;
-        }}
-        header p {{
-            margin: 0;
-            opacity: 0.85;
-        }}
-        main {{
-            padding: 2rem 3rem 4rem;
-        }}
-        .summary {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-            gap: 1rem;
-            margin-bottom: 2rem;
-        }}
-        .metric {{
-            background: white;
-            border-radius: 0.75rem;
-            padding: 1rem 1.25rem;
-            box-shadow: 0 10px 25px rgba(31, 35, 45, 0.1);
-        }}
-        .metric .label {{
-            display: block;
-            font-size: 0.85rem;
-            text-transform: uppercase;
-            letter-spacing: 0.08em;
-            color: #5b6170;
-            margin-bottom: 0.35rem;
-        }}
-        .metric .value {{
-            font-size: 1.75rem;
-            font-weight: 600;
-        }}
-        .filters {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
-            gap: 1.5rem;
-            margin-bottom: 2rem;
-        }}
-        .filters h2 {{
-            margin-bottom: 0.5rem;
-        }}
-        .filter-group {{
-            display: flex;
-            flex-wrap: wrap;
-            gap: 0.5rem;
-        }}
-        .filter-link {{
-            display: inline-flex;
-            align-items: center;
-            border-radius: 999px;
-            padding: 0.35rem 0.9rem;
-            background: rgba(115, 36, 255, 0.1);
-            color: #4520a5;
-            text-decoration: none;
-            font-weight: 500;
-        }}
-        .filter-link.active {{
-            background: #4520a5;
-            color: white;
-        }}
-        table.orders {{
-            width: 100%;
-            border-collapse: collapse;
-            background: white;
-            border-radius: 1rem;
-            overflow: hidden;
-            box-shadow: 0 10px 30px rgba(31, 35, 45, 0.12);
-        }}
-        table.orders th {{
-            text-align: left;
-            padding: 0.75rem 1rem;
-            background: #f0f2f8;
-            color: #3a3f4b;
-            font-size: 0.9rem;
-            text-transform: uppercase;
-            letter-spacing: 0.05em;
-        }}
-        table.orders td {{
-            padding: 1rem;
-            vertical-align: top;
-            border-top: 1px solid #eef0f6;
-        }}
-        table.orders tr:first-child td {{
-            border-top: none;
-        }}
-        .status {{
-            display: inline-flex;
-            align-items: center;
-            padding: 0.25rem 0.75rem;
-            border-radius: 999px;
-            background: rgba(40, 69, 255, 0.12);
-            color: #2845ff;
-            font-weight: 600;
-            font-size: 0.85rem;
-        }}
-        details {{
-            margin-top: 0.5rem;
-        }}
-        details summary {{
-            cursor: pointer;
-            font-weight: 600;
-            color: #2845ff;
-        }}
-        ul.items {{
-            margin: 0.5rem 0 0 1rem;
-            padding: 0;
-            list-style-type: disc;
-        }}
-        ul.items li {{
-            margin-bottom: 0.35rem;
-        }}
-        .muted {{
-            color: #6b7183;
-            font-size: 0.85rem;
-        }}
-        pre {{
-            background: #0f172a;
-            color: #e2e8f0;
-            padding: 1rem;
-            border-radius: 0.75rem;
-            overflow-x: auto;
-        }}
-        .empty {{
-            padding: 2rem;
-            background: white;
-            border-radius: 1rem;
-            text-align: center;
-            color: #5b6170;
-            box-shadow: 0 10px 30px rgba(31, 35, 45, 0.05);
-        }}
-        @media (prefers-color-scheme: dark) {{
-            body {{
-                background: #0f172a;
-                color: #e2e8f0;
-            }}
-            header {{
-                box-shadow: 0 20px 40px rgba(0, 0, 0, 0.35);
-            }}
-            .metric, table.orders, .empty {{
-                background: rgba(15, 23, 42, 0.8);
-                box-shadow: 0 10px 30px rgba(15, 23, 42, 0.4);
-            }}
-            table.orders th {{
-                background: rgba(148, 163, 184, 0.15);
-            }}
-            table.orders td {{
-                border-top-color: rgba(148, 163, 184, 0.1);
-            }}
-            .filter-link {{
-                background: rgba(129, 140, 248, 0.2);
-                color: #c7d2fe;
-            }}
-            .filter-link.active {{
-                background: #6366f1;
-            }}
-            .muted {{
-                color: #94a3b8;
-            }}
-            pre {{
-                background: rgba(15, 23, 42, 0.95);
-            }}
-        }}
-    </style>
+    <link rel="stylesheet" href="/static/dashboard.css" />
 </head>
 <body>
     <header>
         <h1>Tectle Orders Dashboard</h1>
-        <p>Showing {len(filtered)} orders (Status: {status_label}, Platform: {platform_label})</p>
+        <p>Showing {count} orders (Status: {status_label}, Platform: {platform_label})</p>
     </header>
     <main>
-        {_render_summary(summary)}
-        {filters_html}
-        {table_html}
+        """
+
+#: Fetches a row's raw payload the first time its details element is
+#: opened, so pages ship without the inline JSON dumps.
+_PAGE_TAIL = b"""
     </main>
+    <script>
+    document.addEventListener("toggle", function (event) {
+        var details = event.target;
+        if (!details.open || !details.dataset.payloadUrl || details.dataset.loaded) {
+            return;
+        }
+        details.dataset.loaded = "1";
+        fetch(details.dataset.payloadUrl)
+            .then(function (response) { return response.text(); })
+            .then(function (text) { details.querySelector("pre").textContent = text; })
+            .catch(function () { details.querySelector("pre").textContent = "Failed to load payload."; });
+    }, true);
+    </script>
 </body>
 </html>
     """
 
 
+def _iter_dashboard(
+    state: DashboardState,
+    *,
+    status_filter: Optional[str] = None,
+    platform_filter: Optional[str] = None,
+) -> Iterator[bytes]:
+    """Yield the dashboard page section by section, as UTF-8 bytes.
+
+    Streaming consumers can write the head and summary to the socket while
+    the order rows are still being rendered; whole-page consumers simply
+    join the sections. Static skeleton fragments are pre-encoded at import
+    time, so only the dynamic sections pay for an encode.
+    """
+
+    filtered = state.filter_orders(status=status_filter, platform=platform_filter)
+    summary = state.organizer.summary(filtered)
+    filters_html = _render_filters(
+        state,
+        active_status=(status_filter or "").lower() or None,
+        active_platform=(platform_filter or "").lower() or None,
+    )
+
+    yield _PAGE_HEAD_TEMPLATE.format(
+        count=len(filtered),
+        status_label=_label(status_filter),
+        platform_label=_label(platform_filter),
+    ).encode("utf-8")
+    yield _render_summary(summary).encode("utf-8")
+    yield filters_html.encode("utf-8")
+    yield from _iter_orders_table(filtered, state._row_cache)
+    yield _PAGE_TAIL
+
+
+def render_dashboard(
+    orders: Sequence[Order],
+    *,
+    status_filter: Optional[str] = None,
+    platform_filter: Optional[str] = None,
+) -> str:
+    """Return the dashboard HTML for the supplied orders.
+
+    Convenience wrapper for callers holding a bare order sequence; it builds
+    a throwaway :class:`DashboardState`. The HTTP handler does not go through
+    here — it renders straight from its long-lived state, whose orders are
+    already sorted and whose pages are cached across requests.
+    """
+
+    state = DashboardState(orders=list(orders), organizer=OrderOrganizer())
+    return b"".join(
+        _iter_dashboard(state, status_filter=status_filter, platform_filter=platform_filter)
+    ).decode("utf-8")
+
+
+def _parse_filter_query(query: str) -> Tuple[Optional[str], Optional[str]]:
+    """Extract the two known filter params without the parse_qs machinery.
+
+    The dashboard's query schema is fixed at ``?status=&platform=``, so a
+    partition-and-split walk replaces urlparse/parse_qs and their per-request
+    dict and list allocations; percent/plus decoding runs only for values
+    that actually contain escapes.
+    """
+
+    status: Optional[str] = None
+    platform: Optional[str] = None
+    if query:
+        for pair in query.split("&"):
+            key, sep, value = pair.partition("=")
+            if not sep or not value:
+                continue
+            if "%" in value or "+" in value:
+                value = unquote_plus(value)
+            if key == "status":
+                status = value.lower()
+            elif key == "platform":
+                platform = value.lower()
+    return status, platform
+
+
 class DashboardHandler(BaseHTTPRequestHandler):
     """HTTP handler that serves the dashboard."""
 
     state: DashboardState
+    #: HTTP/1.1 keeps connections alive between requests, so repeat page
+    #: loads (and the CSS fetch) skip the TCP handshake and handler setup.
+    protocol_version = "HTTP/1.1"
+    #: Idle keep-alive connections drop after this many seconds, releasing
+    #: their thread instead of pinning it in rfile.readline() forever.
+    timeout = 5
+    #: Buffer outgoing writes (the stdlib default is unbuffered) so streamed
+    #: page sections coalesce into few send() syscalls; the base handler
+    #: flushes the buffer at the end of each request.
+    wbufsize = 64 * 1024
 
     def do_GET(self) -> None:  # noqa: N802 - required by BaseHTTPRequestHandler
-        parsed = urlparse(self.path)
-        if parsed.path not in {"/", ""}:
+        path, _, query = self.path.partition("?")
+        if path == "/static/dashboard.css":
+            self.send_response(200)
+            self.send_header("Content-Type", "text/css; charset=utf-8")
+            self.send_header("Content-Length", str(len(_CSS_BYTES)))
+            self.send_header("Cache-Control", "public, max-age=86400, immutable")
+            self.end_headers()
+            self.wfile.write(_CSS_BYTES)
+            return
+        if path.startswith("/order/") and path.endswith(".json"):
+            self._serve_payload(path)
+            return
+        if path not in {"/", ""}:
             self.send_error(404)
             return
 
-        params = parse_qs(parsed.query)
-        status_filter = params.get("status", [None])[0]
-        platform_filter = params.get("platform", [None])[0]
-
-        html_body = render_dashboard(
-            self.state.orders,
-            status_filter=status_filter.lower() if status_filter else None,
-            platform_filter=platform_filter.lower() if platform_filter else None,
-        )
+        status, platform = _parse_filter_query(query)
+
+        body, future, key = self.state.begin_render(status=status, platform=platform)
+        if body is None and key is None:
+            # Another thread is already rendering this exact page; wait for
+            # its bytes instead of duplicating the work. A leader can fail
+            # for reasons local to its own connection (client disconnects
+            # mid-stream) or stall behind a slow reader, so a failed or
+            # overdue future means render independently, not error out.
+            try:
+                body = future.result(timeout=_RENDER_WAIT_TIMEOUT)
+            except Exception:
+                body = b"".join(
+                    _iter_dashboard(
+                        self.state, status_filter=status, platform_filter=platform
+                    )
+                )
+        if body is not None:
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return
 
+        # Cache miss with the render claimed: stream sections to the socket
+        # as they render, so the browser receives the head and summary before
+        # the rows are built. Chunked framing delimits the body and keeps the
+        # connection alive; HTTP/1.0 clients do not understand chunked
+        # framing, so they get the page buffered with a Content-Length.
+        try:
+            if self.request_version == "HTTP/1.1":
+                self.send_response(200)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Transfer-Encoding", "chunked")
+                self.end_headers()
+                sections: List[bytes] = []
+                write = self.wfile.write
+                for section in _iter_dashboard(
+                    self.state, status_filter=status, platform_filter=platform
+                ):
+                    sections.append(section)
+                    write(b"%x\r\n" % len(section))
+                    write(section)
+                    write(b"\r\n")
+                write(b"0\r\n\r\n")
+                page = b"".join(sections)
+            else:
+                page = b"".join(
+                    _iter_dashboard(
+                        self.state, status_filter=status, platform_filter=platform
+                    )
+                )
+                self.send_response(200)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(page)))
+                self.end_headers()
+                self.wfile.write(page)
+            self.state.store_page(key, page)
+            future.set_result(page)
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        finally:
+            self.state.finish_render(key)
+
+    def _serve_payload(self, path: str) -> None:
+        """Serve one order's raw payload as JSON for the lazy row fetch."""
+
+        parts = path[len("/order/"):-len(".json")].split("/")
+        if len(parts) != 2:
+            self.send_error(404)
+            return
+        platform, order_id = (unquote(part) for part in parts)
+        order = self.state.get_order(platform, order_id)
+        if order is None:
+            self.send_error(404)
+            return
+        body = _json_pretty(order.raw_payload if order.raw_payload else {}).encode("utf-8")
         self.send_response(200)
-        self.send_header("Content-Type", "text/html; charset=utf-8")
-        self.send_header("Content-Length", str(len(html_body.encode("utf-8"))))
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
         self.end_headers()
-        self.wfile.write(html_body.encode("utf-8"))
+        self.wfile.write(body)
 
     def log_message(self, format: str, *args: object) -> None:  # noqa: A003 - signature inherited
         return
 
 
+class DashboardServer(ThreadingHTTPServer):
+    """ThreadingHTTPServer that bounds how many connections run at once.
+
+    A semaphore gates dispatch: at most :attr:`max_connections` handler
+    threads exist at a time, and further accepted sockets wait in the
+    kernel's listen backlog, which bounds the burst queue. Handlers stay
+    per-connection daemon threads (the ThreadingHTTPServer default), so
+    idle keep-alive clients never block interpreter exit, and the handler
+    timeout returns their slot when they go quiet.
+    """
+
+    #: Upper bound on concurrently served connections.
+    max_connections = 32
+
+    def __init__(self, *args: object, **kwargs: object) -> None:
+        super().__init__(*args, **kwargs)  # type: ignore[arg-type]
+        self._slots = threading.BoundedSemaphore(self.max_connections)
+
+    def process_request(self, request, client_address) -> None:  # type: ignore[override]
+        self._slots.acquire()
+        super().process_request(request, client_address)
+
+    def process_request_thread(self, request, client_address) -> None:  # type: ignore[override]
+        try:
+            super().process_request_thread(request, client_address)
+        finally:
+            self._slots.release()
+
+
 def _load_payload(path: Optional[Path]) -> Mapping[str, Sequence[Mapping[str, object]]]:
     if path is None:
         return load_sample_payloads()
-    data = json.loads(path.read_text())
+    data = _json_loads_bytes(path.read_bytes())
     if not isinstance(data, Mapping):
         raise ValueError("Payload file must contain a mapping of platform to orders")
     return data  # type: ignore[return-value]
@@ -481,7 +972,7 @@ def launch_dashboard(
     class Handler(DashboardHandler):
         state = dashboard_state  # type: ignore[assignment]
 
-    with ThreadingHTTPServer((host, port), Handler) as httpd:
+    with DashboardServer((host, port), Handler) as httpd:
         address, bound_port = httpd.server_address
         print(f"Dashboard running on http://{address}:{bound_port}")
         try:
@@ -0,0 +1,156 @@
+import http.client
+import json
+import threading
+import time
+
+from tectle.orders.organizer import OrderOrganizer
+from tectle.orders.service import OrderService
+from tectle.ui.sample_data import load_sample_payloads
+from tectle.ui.server import DashboardHandler, DashboardServer, DashboardState
+
+
+def _start_server(*, keep_raw_payload=True):
+    service = OrderService(keep_raw_payload=keep_raw_payload)
+    orders = service.import_all(load_sample_payloads())
+    state = DashboardState(orders=orders, organizer=OrderOrganizer())
+
+    class Handler(DashboardHandler):
+        pass
+
+    Handler.state = state
+    server = DashboardServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, state
+
+
+def _get(server, path):
+    conn = http.client.HTTPConnection("127.0.0.1", server.server_address[1], timeout=10)
+    try:
+        conn.request("GET", path)
+        response = conn.getresponse()
+        return response.status, response.read()
+    finally:
+        conn.close()
+
+
+def test_concurrent_identical_requests_coalesce():
+    server, state = _start_server()
+    try:
+        results = []
+
+        def fetch():
+            results.append(_get(server, "/?platform=etsy"))
+
+        threads = [threading.Thread(target=fetch) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=10)
+
+        assert [status for status, _ in results] == [200] * 6
+        assert len({body for _, body in results}) == 1
+        assert state._in_flight == {}
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_follower_recovers_when_leader_fails():
+    server, state = _start_server()
+    try:
+        # Claim leadership for the unfiltered page so the HTTP request below
+        # becomes a follower waiting on our future.
+        body, future, key = state.begin_render()
+        assert body is None and key is not None
+
+        results = []
+        thread = threading.Thread(target=lambda: results.append(_get(server, "/")))
+        thread.start()
+        time.sleep(0.2)
+
+        # Simulate the leader's client disconnecting mid-stream: the failed
+        # future must not poison the follower's healthy connection.
+        future.set_exception(BrokenPipeError("client went away"))
+        state.finish_render(key)
+        thread.join(timeout=10)
+
+        assert results and results[0][0] == 200
+        assert b"Tectle Orders Dashboard" in results[0][1]
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_page_is_stored_under_the_version_the_render_started_with():
+    server, state = _start_server()
+    try:
+        _, future, key = state.begin_render()
+        state.version += 1  # a mutation lands while the render is in flight
+        state.store_page(key, b"stale page")
+        future.set_result(b"stale page")
+        state.finish_render(key)
+
+        # The stale page is keyed by the pre-mutation version, so a fresh
+        # request renders the current data instead of serving it.
+        status, body = _get(server, "/")
+        assert status == 200
+        assert body != b"stale page"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_order_payload_endpoint_serves_raw_payload():
+    server, state = _start_server()
+    try:
+        order = state.orders[0]
+        status, body = _get(server, f"/order/{order.platform}/{order.id}.json")
+        assert status == 200
+        assert json.loads(body) == order.raw_payload
+
+        # The page itself ships only the fetch placeholder, not the payload.
+        page_status, page = _get(server, "/")
+        assert page_status == 200
+        assert f'data-payload-url="/order/{order.platform}/{order.id}.json"'.encode() in page
+        assert json.dumps(order.raw_payload).encode() not in page
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_order_payload_endpoint_decodes_percent_encoded_ids():
+    server, state = _start_server()
+    try:
+        order = state.orders[0]
+        encoded_id = order.id.replace("-", "%2D")
+        status, body = _get(server, f"/order/{order.platform}/{encoded_id}.json")
+        assert status == 200
+        assert json.loads(body) == order.raw_payload
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_order_payload_endpoint_returns_404_for_unknown_orders():
+    server, _ = _start_server()
+    try:
+        status, _body = _get(server, "/order/etsy/no-such-order.json")
+        assert status == 404
+        status, _body = _get(server, "/order/not-enough-parts.json")
+        assert status == 404
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_order_payload_endpoint_when_raw_payloads_are_dropped():
+    server, state = _start_server(keep_raw_payload=False)
+    try:
+        order = state.orders[0]
+        assert order.raw_payload is None
+        status, body = _get(server, f"/order/{order.platform}/{order.id}.json")
+        assert status == 200
+        assert json.loads(body) == {}
+    finally:
+        server.shutdown()
+        server.server_close()